@@ -2,27 +2,37 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
 from rich.console import Console
+from rich.live import Live
 from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.spinner import Spinner
 from rich.table import Table
+from rich.text import Text
 
 from .config_loader import load_config
 from .models import ZoomRecording
 from .utils import format_date_for_title, parse_date_input
-from .zoom_client import ZoomClient
-from .youtube_client import YouTubeClient
 
 console = Console()
 
 BROWSER_DATA_DIR = "browser_data"
 UPLOAD_LOG = "uploads.json"
 
+# CDP endpoint exposed by `--daemon` and probed by normal runs
+CDP_ENDPOINT = "http://localhost:9222"
+
+# Exportable cookie/localStorage snapshot taken after successful logins;
+# browser_data/ holds the live session, this one can seed fresh contexts
+SESSION_STATE_FILE = Path.home() / ".zoom-yt-uploader" / "state.json"
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Zoom Recording -> YouTube Uploader")
@@ -42,18 +52,50 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Re-upload even if already uploaded (skip confirmation prompt)",
     )
+    parser.add_argument(
+        "--parallel-login",
+        action="store_true",
+        help="Warm up the YouTube Studio login while the Zoom download runs",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep a browser open for reuse by later runs (amortizes Chromium startup)",
+    )
+    parser.add_argument(
+        "--clear-session",
+        action="store_true",
+        help="Forget saved Zoom/YouTube browser sessions and log in fresh",
+    )
     return parser.parse_args()
 
 
+# (mtime_ns, parsed log) — avoids re-reading uploads.json within a process
+_LOG_CACHE: tuple[int, dict] | None = None
+
+
 def _load_upload_log() -> dict:
-    path = Path(UPLOAD_LOG)
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
+    global _LOG_CACHE
+    try:
+        mtime_ns = os.stat(UPLOAD_LOG).st_mtime_ns
+    except OSError:
+        return {}
+    if _LOG_CACHE is not None and _LOG_CACHE[0] == mtime_ns:
+        return _LOG_CACHE[1]
+    with open(UPLOAD_LOG, "rb", buffering=65536) as f:
+        log = json.load(f)
+    _LOG_CACHE = (mtime_ns, log)
+    return log
 
 
 def _save_upload_log(log: dict) -> None:
-    Path(UPLOAD_LOG).write_text(json.dumps(log, indent=2))
+    global _LOG_CACHE
+    # Write-then-rename so a kill mid-write can't corrupt the log
+    tmp = UPLOAD_LOG + ".tmp"
+    with open(tmp, "wb", buffering=65536) as f:
+        f.write(json.dumps(log, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp, UPLOAD_LOG)
+    _LOG_CACHE = (os.stat(UPLOAD_LOG).st_mtime_ns, log)
 
 
 def _prompt_date(cli_date: str | None = None) -> date:
@@ -105,9 +147,120 @@ def _select_recording(recordings: list[ZoomRecording], cli_select: int | None =
     return idx - 1
 
 
+def _save_session_state(context) -> None:
+    """Snapshot cookies/localStorage so fresh contexts can skip login."""
+    try:
+        SESSION_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        context.storage_state(path=str(SESSION_STATE_FILE))
+    except Exception:
+        pass
+
+
+def _restore_session_state(context) -> None:
+    """Seed a fresh profile from the saved snapshot to skip the logins.
+
+    launch_persistent_context has no storage_state parameter, so cookies
+    are injected after launch. Only called when browser_data/ did not
+    exist — an established profile already carries its own session.
+    """
+    try:
+        with open(SESSION_STATE_FILE, "rb") as f:
+            state = json.load(f)
+        cookies = state.get("cookies", [])
+        if cookies:
+            context.add_cookies(cookies)
+            console.print("[dim]Restored saved session cookies.[/dim]")
+    except OSError:
+        pass  # no snapshot yet — first run or after --clear-session
+    except Exception:
+        pass
+
+
+def _launch_browser_context(pw, extra_args: list[str] | None = None):
+    """Launch the shared persistent browser context (always headed)."""
+    return pw.chromium.launch_persistent_context(
+        user_data_dir=BROWSER_DATA_DIR,
+        headless=False,
+        viewport={"width": 1280, "height": 900},
+        accept_downloads=True,
+        # Land browser downloads on the same filesystem as dest_path so the
+        # final move is a rename, not a second full-file write
+        downloads_path=tempfile.gettempdir(),
+        timeout=120_000,  # 2 min default for all actions
+        args=[
+            "--disable-blink-features=AutomationControlled",
+            *(extra_args or []),
+        ],
+        ignore_default_args=["--enable-automation"],
+    )
+
+
+def _run_daemon() -> None:
+    """Hold a browser open with a CDP port so later runs skip cold start.
+
+    Python Playwright has no launch_server, so the daemon is a persistent
+    context exposing Chromium's remote-debugging port; normal runs attach
+    via connect_over_cdp.
+    """
+    import time
+
+    from playwright.sync_api import sync_playwright
+
+    pw = sync_playwright().start()
+    port = CDP_ENDPOINT.rsplit(":", 1)[-1]
+    context = _launch_browser_context(pw, [f"--remote-debugging-port={port}"])
+    console.print(
+        f"[bold]Browser daemon listening on {CDP_ENDPOINT}[/bold] — "
+        "press Ctrl+C to stop."
+    )
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        context.close()
+        pw.stop()
+
+
+def _warm_yt_login() -> bool:
+    """Warm up the YouTube Studio login from a worker thread.
+
+    Playwright's sync API is greenlet-bound to the thread that started it,
+    so the worker must not touch the main thread's Playwright objects at
+    all — it attaches its own instance to the shared browser over CDP and
+    drives a throwaway page there. Returns True when Studio is logged in.
+    """
+    from playwright.sync_api import sync_playwright
+
+    from .youtube_client import YouTubeClient
+
+    pw = sync_playwright().start()
+    try:
+        browser = pw.chromium.connect_over_cdp(CDP_ENDPOINT, timeout=5000)
+        yt_warm = YouTubeClient(browser.contexts[0])
+        try:
+            yt_warm.ensure_logged_in()
+        finally:
+            yt_warm.close_page()
+        return True
+    finally:
+        pw.stop()
+
+
 def run() -> None:
     """Main CLI flow."""
     args = _parse_args()
+
+    if args.daemon:
+        _run_daemon()
+        return
+
+    # Deferred: Playwright and the clients (keyring, etc.) cost hundreds of
+    # ms to import — don't pay that for --help or an early config error.
+    from playwright.sync_api import sync_playwright
+    from .zoom_client import ZoomClient
+    from .youtube_client import YouTubeClient
     console.print("[bold]Zoom Recording -> YouTube Uploader[/bold]\n")
 
     # 1. Load config
@@ -117,34 +270,66 @@ def run() -> None:
     recording_date = _prompt_date(args.date)
     console.print(f"Looking up recordings for: [cyan]{recording_date.isoformat()}[/cyan]\n")
 
+    if args.clear_session:
+        import shutil
+
+        shutil.rmtree(BROWSER_DATA_DIR, ignore_errors=True)
+        SESSION_STATE_FILE.unlink(missing_ok=True)
+        console.print("[yellow]Cleared saved browser session — expect login prompts.[/yellow]")
+
     # 3. Launch browser (shared by Zoom and YouTube)
+    fresh_profile = not os.path.isdir(BROWSER_DATA_DIR)
     pw = sync_playwright().start()
-    # Always headed — user may need to log in to either Zoom or YouTube
-    context = pw.chromium.launch_persistent_context(
-        user_data_dir=BROWSER_DATA_DIR,
-        headless=False,
-        viewport={"width": 1280, "height": 900},
-        accept_downloads=True,
-        timeout=120_000,  # 2 min default for all actions
-        args=[
-            "--disable-blink-features=AutomationControlled",
-        ],
-        ignore_default_args=["--enable-automation"],
-    )
+    # Reuse a --daemon browser when one is listening; otherwise cold-start
+    own_context = False
+    try:
+        browser = pw.chromium.connect_over_cdp(CDP_ENDPOINT, timeout=1000)
+        context = browser.contexts[0]
+        console.print("[dim]Reusing running browser daemon.[/dim]")
+    except Exception:
+        extra_args = None
+        if args.parallel_login:
+            # The login warmup thread attaches over CDP, so the cold-start
+            # browser needs the debugging port open too (the daemon already
+            # exposes it)
+            port = CDP_ENDPOINT.rsplit(":", 1)[-1]
+            extra_args = [f"--remote-debugging-port={port}"]
+        context = _launch_browser_context(pw, extra_args)
+        own_context = True
+        if fresh_profile:
+            _restore_session_state(context)
+
+    # One Live panel for all progress states — console.status spins up and
+    # tears down a renderer thread per block; updating one display doesn't.
+    live = Live(Text(""), console=console, refresh_per_second=8)
+    live.start()
+
+    def _status(message: str | None = None) -> None:
+        live.update(Spinner("dots", text=message) if message else Text(""))
+
+    save_thread: threading.Thread | None = None
 
     try:
         # 4. Zoom: log in and list recordings
         zoom = ZoomClient(context)
-        with console.status("Connecting to Zoom..."):
-            zoom.ensure_logged_in()
+        _status("Connecting to Zoom...")
+        zoom.ensure_logged_in()
+        _status()
+        _save_session_state(context)
         console.print("[green]Zoom ready.[/green]\n")
 
-        with console.status("Fetching recordings..."):
-            try:
-                recordings = zoom.list_recordings(recording_date)
-            except Exception as e:
-                console.print(f"[red]Failed to fetch recordings: {e}[/red]")
-                sys.exit(1)
+        _status("Fetching recordings...")
+        try:
+            recordings = zoom.list_recordings(recording_date)
+        except Exception as e:
+            console.print(f"[red]Failed to fetch recordings: {e}[/red]")
+            sys.exit(1)
+        _status()
+
+        # Pause the live display across the interactive prompts below — its
+        # refresh thread redraws over pending input() otherwise (the old
+        # console.status blocks were always closed before prompting)
+        live.stop()
 
         if not recordings:
             console.print("[yellow]No recordings found for this date.[/yellow]")
@@ -159,9 +344,7 @@ def run() -> None:
             console.print()
             selected = recordings[_select_recording(recordings, args.select)]
 
-        title = config.defaults.title_format.format(
-            date=format_date_for_title(recording_date)
-        )
+        title = config.defaults.render_title(format_date_for_title(recording_date))
 
         # 6. Check if already uploaded
         upload_log = _load_upload_log()
@@ -174,13 +357,21 @@ def run() -> None:
                 console.print("Aborted.")
                 sys.exit(0)
 
+        # Prompts done — resume the live display for the long-running steps
+        live.start()
+
         # 7. Download MP4 from Zoom
         filename = f"{title.replace(' ', '_')}.mp4"
         dest_path = Path(tempfile.gettempdir()) / filename
 
-        if dest_path.exists():
-            # Validate existing file before reusing it
+        # Validate any existing file before reusing it; one stat via
+        # try/except instead of exists() + stat() + exists()
+        have_file = False
+        try:
             size = dest_path.stat().st_size
+        except FileNotFoundError:
+            pass
+        else:
             if size == 0:
                 console.print("[red]Existing file is empty — re-downloading.[/red]")
                 dest_path.unlink()
@@ -195,50 +386,79 @@ def run() -> None:
                         f"[yellow]File already exists: {dest_path} "
                         f"({size / (1024 * 1024):.1f} MB) — skipping download.[/yellow]"
                     )
+                    have_file = True
 
-        if not dest_path.exists():
+        yt = YouTubeClient(context)
+        yt_ready = False
+
+        if not have_file:
             console.print()
-            with console.status("Downloading recording (watch browser)..."):
-                try:
+            _status("Downloading recording (watch browser)...")
+            try:
+                if args.parallel_login:
+                    # Overlap the YouTube auth round-trip with the (much
+                    # longer) MP4 download. The download stays on the main
+                    # thread (sync Playwright objects can't cross threads);
+                    # the warmup gets its own Playwright over CDP.
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        login_future = pool.submit(_warm_yt_login)
+                        zoom.download_recording(selected, dest_path)
+                        try:
+                            yt_ready = login_future.result()
+                        except Exception:
+                            console.print(
+                                "[yellow]Parallel YouTube login failed — "
+                                "retrying serially.[/yellow]"
+                            )
+                else:
                     zoom.download_recording(
                         selected,
                         dest_path,
                     )
-                except Exception as e:
-                    console.print(f"\n[red]Download failed: {e}[/red]")
-                    sys.exit(1)
+            except Exception as e:
+                console.print(f"\n[red]Download failed: {e}[/red]")
+                sys.exit(1)
+            _status()
             console.print(f"[green]Downloaded:[/green] {dest_path}")
 
         zoom.close_page()
 
         # 8. YouTube: log in
         console.print()
-        yt = YouTubeClient(context)
-        with console.status("Connecting to YouTube Studio..."):
+        if not yt_ready:
+            _status("Connecting to YouTube Studio...")
             yt.ensure_logged_in()
+            _status()
+        _save_session_state(context)
         console.print("[green]YouTube Studio ready.[/green]")
 
         # 9. Upload video (includes thumbnail + playlist)
         console.print()
-        with console.status("Uploading to YouTube (watch browser for progress)..."):
-            try:
-                result = yt.upload_video(
-                    file_path=dest_path,
-                    title=title,
-                    description=config.defaults.description,
-                    privacy_status=config.defaults.privacy_status,
-                    made_for_kids=config.defaults.made_for_kids,
-                    thumbnail_file=config.youtube.thumbnail_file or None,
-                    playlist_name=config.youtube.playlist_name or None,
-                )
-            except Exception as e:
-                console.print(f"\n[red]Upload failed: {e}[/red]")
-                sys.exit(1)
+        _status("Uploading to YouTube (watch browser for progress)...")
+        try:
+            result = yt.upload_video(
+                file_path=dest_path,
+                title=title,
+                description=config.defaults.description,
+                privacy_status=config.defaults.privacy_status,
+                made_for_kids=config.defaults.made_for_kids,
+                thumbnail_file=config.youtube.thumbnail_file or None,
+                playlist_name=config.youtube.playlist_name or None,
+            )
+        except Exception as e:
+            console.print(f"\n[red]Upload failed: {e}[/red]")
+            sys.exit(1)
+        _status()
 
-        # 10. Print result and save to log
+        # 10. Print result and save to log (skip the write if nothing
+        # changed; the disk write rides on a thread so the URL prints now)
         console.print()
-        upload_log[title] = result.url
-        _save_upload_log(upload_log)
+        if upload_log.get(title) != result.url:
+            upload_log[title] = result.url
+            save_thread = threading.Thread(
+                target=_save_upload_log, args=(upload_log,), daemon=True
+            )
+            save_thread.start()
 
         if result.video_id != "unknown":
             console.print(f"[bold green]Done! Video URL: {result.url}[/bold green]")
@@ -251,7 +471,11 @@ def run() -> None:
         yt.close_page()
 
     finally:
-        context.close()
+        if save_thread is not None:
+            save_thread.join(timeout=10)
+        live.stop()
+        if own_context:
+            context.close()
         pw.stop()
 
     # 11. Cleanup
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
+import os
 import sys
 from dataclasses import dataclass, field
-from pathlib import Path
-
-import yaml
+from functools import lru_cache
 
 
 @dataclass
@@ -19,6 +18,24 @@ class DefaultsConfig:
     description: str = "Kubernetes SIG Windows weekly meeting recording."
     privacy_status: str = "public"
     made_for_kids: bool = False
+    # Pre-split around {date} at load time so batch callers skip str.format
+    _title_parts: tuple[str, str] | None = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        # The fast path must render byte-for-byte what str.format would, so
+        # it only applies when {date} appears once and the rest of the
+        # template carries no braces at all (no repeats, no {{ }} escapes)
+        prefix, sep, suffix = self.title_format.partition("{date}")
+        rest = prefix + suffix
+        self._title_parts = (
+            (prefix, suffix) if sep and "{" not in rest and "}" not in rest else None
+        )
+
+    def render_title(self, date_str: str) -> str:
+        if self._title_parts is None:
+            return self.title_format.format(date=date_str)
+        prefix, suffix = self._title_parts
+        return prefix + date_str + suffix
 
 
 @dataclass
@@ -28,16 +45,31 @@ class AppConfig:
 
 
 def load_config(path: str = "config.yaml") -> AppConfig:
-    config_path = Path(path)
-    if not config_path.exists():
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
         print(
             f"Config file '{path}' not found.\n"
             "Copy config.example.yaml to config.yaml and fill in your settings."
         )
         sys.exit(1)
 
-    with open(config_path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    # Keyed by mtime so an edited config is re-read, an unchanged one is not
+    return _load_config_cached(path, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int) -> AppConfig:
+    import yaml  # deferred: only needed on a cache miss
+
+    # libyaml-backed loader is ~10x faster than the pure-Python one
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path, encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=SafeLoader)
 
     if not isinstance(raw, dict):
         print(f"Invalid config file: {path}")
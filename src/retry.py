@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+import time
+from functools import wraps
+
+from playwright.sync_api import Error as PlaywrightError
+
+
+def retry(
+    max_retries: int = 3,
+    base: float = 0.5,
+    jitter: float = 0.5,
+    recoverable: tuple[type[BaseException], ...] = (TimeoutError, PlaywrightError),
+):
+    """Retry transient Playwright/network failures with exponential backoff.
+
+    Sleeps base * 2**attempt seconds (plus up to `jitter` proportional
+    random spread) between attempts and re-raises after the last one.
+    Intended for navigation and click steps where a second attempt is much
+    cheaper than failing the whole run.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except recoverable:
+                    if attempt == max_retries - 1:
+                        raise
+                    time.sleep(base * (2 ** attempt) * (1 + random.random() * jitter))
+        return wrapper
+    return decorator
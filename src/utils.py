@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 
 def parse_date_input(text: str) -> date:
@@ -9,24 +9,30 @@ def parse_date_input(text: str) -> date:
     Accepts: YYYY-MM-DD, YYYYMMDD, MM-DD (current year), "today", "yesterday".
     """
     text = text.strip().lower()
+    today = date.today()
 
     if text == "today":
-        return date.today()
+        return today
     if text == "yesterday":
-        return date.today() - timedelta(days=1)
-
-    # YYYY-MM-DD
-    if len(text) == 10 and text[4] == "-":
-        return datetime.strptime(text, "%Y-%m-%d").date()
-
-    # YYYYMMDD
-    if len(text) == 8 and text.isdigit():
-        return datetime.strptime(text, "%Y%m%d").date()
-
-    # MM-DD (assume current year)
-    if len(text) <= 5 and "-" in text:
-        parsed = datetime.strptime(text, "%m-%d").date()
-        return parsed.replace(year=date.today().year)
+        return today - timedelta(days=1)
+
+    # Direct int slicing — strptime's format parsing is overkill for these
+    # fixed layouts and dominates the cost of this function.
+    try:
+        # YYYY-MM-DD
+        if len(text) == 10 and text[4] == "-":
+            return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+
+        # YYYYMMDD
+        if len(text) == 8 and text.isdigit():
+            return date(int(text[0:4]), int(text[4:6]), int(text[6:8]))
+
+        # MM-DD (assume current year)
+        if len(text) <= 5 and "-" in text:
+            mm, dd = text.split("-")
+            return date(today.year, int(mm), int(dd))
+    except ValueError:
+        pass
 
     raise ValueError(
         f"Cannot parse date '{text}'. "
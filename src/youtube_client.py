@@ -1,38 +1,123 @@
 from __future__ import annotations
 
+import os
 import platform
+import re
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import BrowserContext, Page
+from playwright.sync_api import BrowserContext, Locator, Page
 from rich.console import Console
 
 from .models import UploadResult
+from .retry import retry
 
 console = Console()
 
+# Video IDs are 11 chars of [A-Za-z0-9_-] after any of these URL shapes
+_ID_RE = re.compile(r"(?:youtu\.be/|youtube\.com/video/|/video/)([A-Za-z0-9_-]{11})")
+
+# Select-all key binding is platform-invariant for the process lifetime
+_SELECT_ALL = "Meta+a" if platform.system() == "Darwin" else "Control+a"
+
+# Set FAST_TYPE=0 to fall back to real keystrokes if YouTube ever rejects
+# programmatic contenteditable input.
+_FAST_TYPE = os.environ.get("FAST_TYPE", "1") != "0"
+
+# FAST_MODE=1 blocks images/fonts/media during navigation — the CLI doesn't
+# need them until the details step (thumbnail preview).
+_FAST_MODE = os.environ.get("FAST_MODE") == "1"
+
+# YT_DEBUG=1 re-enables failure screenshots (full-page render + disk write)
+_DEBUG = os.environ.get("YT_DEBUG") == "1"
+
+
+def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in ("image", "font", "media"):
+        route.abort()
+    else:
+        route.continue_()
+
+# One insertText per field instead of a key event (plus 15 ms timer) per char
+_FILL_TEXTBOX_JS = """(el, value) => {
+    el.focus();
+    document.execCommand('selectAll');
+    document.execCommand('insertText', false, value);
+}"""
+
+# Upload-settled predicate for wait_for_function. Studio keeps empty or
+# hidden error containers in the DOM while an upload is healthy, so the
+# error arm requires visibility (offsetParent) plus keyword text — the
+# same selectors and keywords as the poll this replaced, minus its
+# full-body innerText scan.
+_UPLOAD_ERROR_SELECTOR = (
+    '.error-area, .error-message, .upload-error, [class*="error"]'
+)
+_UPLOAD_SETTLED_JS = """() => {
+    const done = document.querySelector('#done-button');
+    if (done && done.getAttribute('aria-disabled') !== 'true') return true;
+    const sel = '%s';
+    for (const el of document.querySelectorAll(sel)) {
+        if (el.offsetParent === null) continue;
+        const text = el.textContent.trim().toLowerCase();
+        if (text && (text.includes('abandoned') || text.includes('failed')
+            || text.includes('error') || text.includes('problem')
+            || text.includes('unable') || text.includes("can't process"))) {
+            return true;
+        }
+    }
+    return false;
+}""" % _UPLOAD_ERROR_SELECTOR
+
 
 class YouTubeClient:
     def __init__(self, context: BrowserContext):
         self._context = context
         self._page: Optional[Page] = None
+        self._locators: dict[str, Locator] = {}
 
     def _get_page(self) -> Page:
         if self._page is None:
             self._page = self._context.new_page()
         return self._page
 
+    def _loc(self, selector: str) -> Locator:
+        """Memoized page.locator() for selectors reused across the flow."""
+        loc = self._locators.get(selector)
+        if loc is None:
+            loc = self._locators[selector] = self._get_page().locator(selector)
+        return loc
+
+    def _debug_shot(self, name: str) -> None:
+        """Capture a viewport screenshot when YT_DEBUG=1 (JPEG — much
+        cheaper to encode and store than a full-page PNG)."""
+        if _DEBUG:
+            try:
+                self._page.screenshot(
+                    path=name, type="jpeg", quality=60, full_page=False
+                )
+            except Exception:
+                pass
+
     def _dismiss_overlays(self) -> None:
-        """Press Escape to close any open dialogs/overlays."""
+        """Press Escape and wait for any open dialog/overlay to close."""
+        page = self._page
         try:
-            self._page.keyboard.press("Escape")
-            self._page.wait_for_timeout(500)
+            page.keyboard.press("Escape")
+            page.wait_for_selector(
+                "tp-yt-paper-dialog, [role='dialog']",
+                state="hidden",
+                timeout=2000,
+            )
         except Exception:
             pass
 
+    @retry(max_retries=2)
     def ensure_logged_in(self) -> None:
         """Navigate to YouTube Studio; if not logged in, wait for user."""
         page = self._get_page()
+        if _FAST_MODE:
+            page.route("**/*", _block_heavy_resources)
         page.goto("https://studio.youtube.com")
         page.wait_for_load_state("domcontentloaded")
 
@@ -58,54 +143,72 @@ class YouTubeClient:
     ) -> UploadResult:
         """Upload a video through YouTube Studio UI."""
         page = self._get_page()
-        file_path = Path(file_path).resolve()
+        file_str = str(Path(file_path).resolve())
 
-        # Navigate to YouTube Studio
+        # Hoist strings the fallback branches would otherwise recompute
+        kids_name = "NOT_MADE_FOR_KIDS" if not made_for_kids else "MADE_FOR_KIDS"
+        kids_label = (
+            "No, it's not made for kids" if not made_for_kids
+            else "Yes, it's made for kids"
+        )
+        privacy_name = privacy_status.upper()
+        privacy_label = privacy_status.capitalize()
+
+        # Navigate to YouTube Studio and wait for it to settle. Studio's
+        # background beacons can keep the network busy indefinitely, so a
+        # networkidle timeout is not an error — the CREATE-button wait below
+        # has its own timeout and direct-URL fallback.
         page.goto("https://studio.youtube.com")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(3000)
-
-        # Try multiple selectors for the CREATE button
-        create_btn = None
-        for sel in [
-            "#create-icon",
-            '[aria-label="Create"]',
-            'button:has-text("Create")',
-            "#upload-icon",
-        ]:
-            loc = page.locator(sel)
-            if loc.count() > 0 and loc.first.is_visible():
-                create_btn = loc.first
-                break
-
-        if create_btn:
+        try:
+            page.wait_for_load_state("networkidle", timeout=15_000)
+        except Exception:
+            pass
+
+        # One union locator instead of probing each selector over IPC —
+        # same or_() shape as the Publish/Save union below
+        create_btn = (
+            page.locator("#create-icon")
+            .or_(page.locator('[aria-label="Create"]'))
+            .or_(page.locator('button:has-text("Create")'))
+            .or_(page.locator("#upload-icon"))
+        ).first
+        try:
+            create_btn.wait_for(state="visible", timeout=3000)
             create_btn.click()
             page.get_by_text("Upload videos").click()
-        else:
+        except Exception:
             page.goto("https://studio.youtube.com/channel/UC/videos/upload?d=ud")
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            page.wait_for_selector('input[type="file"]', state="attached", timeout=10_000)
 
         # Set file via hidden input
-        page.locator('input[type="file"]').set_input_files(str(file_path))
+        self._loc('input[type="file"]').set_input_files(file_str)
 
         # Wait for details form
-        page.wait_for_selector("#title-textarea", timeout=60_000)
-        page.wait_for_timeout(1500)
+        page.wait_for_selector("#title-textarea", state="visible", timeout=60_000)
 
         # --- Details step ---
 
-        # Set title
-        title_box = page.locator("#title-textarea #textbox")
-        title_box.click()
-        select_all = "Meta+a" if platform.system() == "Darwin" else "Control+a"
-        page.keyboard.press(select_all)
-        page.keyboard.type(title, delay=15)
+        # Re-allow images etc. — the thumbnail preview needs them
+        if _FAST_MODE:
+            page.unroute("**/*", _block_heavy_resources)
+
+        # Set title — fill() replaces the contenteditable content in one
+        # protocol action (Studio accepts programmatic fills here)
+        title_box = self._loc("#title-textarea #textbox")
+        if _FAST_TYPE:
+            title_box.fill(title)
+        else:
+            title_box.click()
+            page.keyboard.press(_SELECT_ALL)
+            page.keyboard.type(title)
 
         # Set description
-        desc_box = page.locator("#description-textarea #textbox")
-        desc_box.click()
-        page.keyboard.type(description, delay=15)
+        desc_box = self._loc("#description-textarea #textbox")
+        if _FAST_TYPE:
+            desc_box.evaluate(_FILL_TEXTBOX_JS, description)
+        else:
+            desc_box.click()
+            page.keyboard.type(description)
 
         # Set thumbnail
         if thumbnail_file:
@@ -117,123 +220,132 @@ class YouTubeClient:
 
         # Scroll down to "made for kids" section
         page.mouse.wheel(0, 300)
-        page.wait_for_timeout(500)
+        try:
+            page.wait_for_selector(f'[name="{kids_name}"]', state="attached", timeout=5000)
+        except Exception:
+            pass
 
         # Set audience (made for kids)
-        kids_name = "NOT_MADE_FOR_KIDS" if not made_for_kids else "MADE_FOR_KIDS"
         try:
             page.locator(f'[name="{kids_name}"]').click(timeout=5000)
         except Exception:
             try:
-                label = "No, it's not made for kids" if not made_for_kids else "Yes, it's made for kids"
-                page.get_by_text(label, exact=False).first.click(timeout=5000)
+                page.get_by_text(kids_label, exact=False).first.click(timeout=5000)
             except Exception:
                 console.print("[yellow]Could not set 'made for kids' — skipping.[/yellow]")
 
-        page.wait_for_timeout(1000)
+        # Proceed as soon as the Next button is actionable
+        try:
+            page.wait_for_selector(
+                "#next-button:not([aria-disabled='true'])",
+                state="attached",
+                timeout=5000,
+            )
+        except Exception:
+            pass
 
         # --- Click NEXT through: Video elements → Checks → Visibility ---
+        next_btn = self._loc("#next-button")
         for step in range(3):
             try:
-                page.locator("#next-button").click(timeout=10_000)
-                page.wait_for_timeout(2000)
+                next_btn.click(timeout=10_000)
+                # The button disables while the step transitions, then re-enables
+                page.wait_for_selector(
+                    "#next-button:not([aria-disabled='true']), #done-button",
+                    state="attached",
+                    timeout=10_000,
+                )
             except Exception:
                 console.print(f"[yellow]Could not click Next at step {step + 1}.[/yellow]")
-                page.screenshot(path=f"yt_debug_step{step + 1}.png")
+                self._debug_shot(f"yt_debug_step{step + 1}.jpg")
 
         # --- Visibility step ---
         try:
-            page.locator(f'[name="{privacy_status.upper()}"]').click(timeout=5000)
+            page.locator(f'[name="{privacy_name}"]').click(timeout=5000)
         except Exception:
             try:
-                page.get_by_role("radio", name=privacy_status.capitalize()).click(timeout=5000)
+                page.get_by_role("radio", name=privacy_label).click(timeout=5000)
             except Exception:
                 console.print(f"[yellow]Could not set visibility to '{privacy_status}'.[/yellow]")
-                page.screenshot(path="yt_debug_visibility.png")
+                self._debug_shot("yt_debug_visibility.jpg")
 
-        page.wait_for_timeout(1000)
+        # Wait for upload/processing to finish: the settled predicate runs
+        # in-page on animation frames (no IPC round-trip per poll, no
+        # full-body innerText scan), and a response listener captures failed
+        # upload XHRs for diagnostics.
+        upload_xhr_errors: list[str] = []
 
-        # Wait for upload/processing to finish while checking for errors
-        try:
-            page.wait_for_function(
-                """() => {
-                    // Check for error states in the upload dialog
-                    const errorSelectors = [
-                        '.error-area',
-                        '.error-message',
-                        '[class*="error"]',
-                        '.upload-error',
-                    ];
-                    for (const sel of errorSelectors) {
-                        const el = document.querySelector(sel);
-                        if (el && el.offsetParent !== null && el.textContent.trim()) {
-                            const text = el.textContent.trim().toLowerCase();
-                            if (text.includes('abandoned') || text.includes('failed')
-                                || text.includes('error') || text.includes('problem')
-                                || text.includes('can\\'t process') || text.includes('unable')) {
-                                window.__ytUploadError = el.textContent.trim();
-                                return true;
-                            }
-                        }
-                    }
-
-                    // Check all visible text for "processing abandoned"
-                    const body = document.body.innerText.toLowerCase();
-                    if (body.includes('processing abandoned')
-                        || body.includes('upload failed')
-                        || body.includes('can\\'t process this video')
-                        || body.includes('server rejected')) {
-                        window.__ytUploadError = 'Upload error detected in page';
-                        return true;
-                    }
+        def _on_response(response) -> None:
+            # Only YouTube's own upload endpoints — a 4xx from an unrelated
+            # beacon must not show up in the failure diagnostics
+            try:
+                url = response.url
+                if response.status >= 400 and (
+                    "upload.youtube.com" in url or "/upload" in url
+                ):
+                    upload_xhr_errors.append(f"{response.status} {url}")
+            except Exception:
+                pass
 
-                    // Check if done button is enabled (upload succeeded)
-                    const btn = document.querySelector('#done-button');
-                    if (btn && btn.getAttribute('aria-disabled') !== 'true') {
-                        window.__ytUploadError = '';
-                        return true;
-                    }
-                    return false;
-                }""",
-                timeout=600_000,
-            )
+        page.on("response", _on_response)
+        try:
+            page.wait_for_function(_UPLOAD_SETTLED_JS, timeout=600_000)
         except Exception as e:
-            page.screenshot(path="yt_debug_upload_timeout.png")
+            self._debug_shot("yt_debug_upload_timeout.jpg")
             progress = self._get_upload_status_text()
             raise RuntimeError(
                 f"Upload timed out. Progress at timeout: {progress}. "
-                f"Screenshot saved to yt_debug_upload_timeout.png"
+                f"Failed upload requests: {upload_xhr_errors or 'none'}."
             ) from e
-
-        # Check if the wait ended due to an error rather than success
-        upload_error = page.evaluate("() => window.__ytUploadError || ''")
+        finally:
+            page.remove_listener("response", _on_response)
+
+        # Check whether the wait ended on an error banner rather than success
+        upload_error = page.evaluate("""() => {
+            const sel = '%s';
+            for (const el of document.querySelectorAll(sel)) {
+                if (el.offsetParent === null) continue;
+                const text = el.textContent.trim();
+                const lower = text.toLowerCase();
+                if (lower && (lower.includes('abandoned') || lower.includes('failed')
+                    || lower.includes('error') || lower.includes('problem')
+                    || lower.includes('unable') || lower.includes("can't process"))) {
+                    return text;
+                }
+            }
+            return '';
+        }""" % _UPLOAD_ERROR_SELECTOR)
         if upload_error:
-            page.screenshot(path="yt_debug_upload_error.png")
+            self._debug_shot("yt_debug_upload_error.jpg")
             status_text = self._get_upload_status_text()
             raise RuntimeError(
                 f"YouTube upload error: {upload_error}. "
                 f"Status text: {status_text}. "
-                f"Screenshot saved to yt_debug_upload_error.png"
+                f"Failed upload requests: {upload_xhr_errors or 'none'}."
             )
 
-        page.wait_for_timeout(1000)
+        # Click Publish/Save — one union locator instead of a 3-step
+        # try/except ladder with sequential timeouts
+        publish_btn = (
+            self._loc("#done-button")
+            .or_(page.get_by_role("button", name="Publish"))
+            .or_(page.get_by_role("button", name="Save"))
+        )
+        try:
+            publish_btn.first.click(timeout=10_000)
+        except Exception:
+            self._debug_shot("yt_debug_publish.jpg")
+            raise RuntimeError("Could not click Publish/Save button.")
 
-        # Click Publish/Save — use #done-button directly, not text matching
+        # Wait for the success dialog's share link rather than a fixed sleep
         try:
-            page.locator("#done-button").click(timeout=10_000)
+            page.wait_for_selector(
+                'a[href*="youtu.be"], a[href*="youtube.com/video"]',
+                state="attached",
+                timeout=10_000,
+            )
         except Exception:
-            # Try role-based button match
-            try:
-                page.get_by_role("button", name="Publish").click(timeout=5000)
-            except Exception:
-                try:
-                    page.get_by_role("button", name="Save").click(timeout=5000)
-                except Exception:
-                    page.screenshot(path="yt_debug_publish.png")
-                    raise RuntimeError("Could not click Publish/Save button.")
-
-        # Wait for success dialog and extract video URL
-        page.wait_for_timeout(5000)
+            pass
         video_id = self._extract_video_id()
 
         return UploadResult(video_id=video_id, title=title)
@@ -248,39 +360,53 @@ class YouTubeClient:
             with page.expect_file_chooser(timeout=5000) as fc_info:
                 page.get_by_text("Upload thumbnail", exact=False).first.click()
             fc_info.value.set_files(resolved)
-            page.wait_for_timeout(2000)
+            self._wait_for_thumbnail_preview()
             return
         except Exception:
             pass
 
         # Try file inputs that accept images
-        for sel in [
-            'input[type="file"][accept*="image"]',
-            '#still-picker input[type="file"]',
-        ]:
-            try:
-                page.locator(sel).first.set_input_files(resolved, timeout=3000)
-                page.wait_for_timeout(2000)
-                return
-            except Exception:
-                continue
+        try:
+            page.locator(
+                'input[type="file"][accept*="image"], '
+                '#still-picker input[type="file"]'
+            ).first.set_input_files(resolved, timeout=3000)
+            self._wait_for_thumbnail_preview()
+            return
+        except Exception:
+            pass
 
         console.print("[yellow]Could not set thumbnail — skipping.[/yellow]")
-        page.screenshot(path="yt_debug_thumbnail.png")
+        self._debug_shot("yt_debug_thumbnail.jpg")
+
+    def _wait_for_thumbnail_preview(self) -> None:
+        """Wait for the uploaded thumbnail to render instead of sleeping."""
+        try:
+            self._page.wait_for_selector(
+                "ytcp-thumbnail-uploader img, #still-picker img",
+                state="attached",
+                timeout=5000,
+            )
+        except Exception:
+            pass
 
     def _set_playlist(self, playlist_name: str) -> None:
         """Select a playlist by name in the details step."""
         page = self._page
         try:
-            # Open playlist selector
+            # Open playlist selector and wait for the dialog to appear
             page.locator("ytcp-video-metadata-playlists").click(timeout=5000)
-            page.wait_for_timeout(1000)
+            page.wait_for_selector(
+                "ytcp-playlist-dialog, tp-yt-paper-dialog",
+                state="visible",
+                timeout=5000,
+            )
 
-            # Check the target playlist
+            # Check the target playlist — click() auto-waits, so the Done
+            # click below needs no settling sleep
             checkbox = page.locator(f'label:has-text("{playlist_name}")')
             if checkbox.count() > 0:
                 checkbox.first.click()
-                page.wait_for_timeout(500)
             else:
                 console.print(f"[yellow]Playlist '{playlist_name}' not found — skipping.[/yellow]")
 
@@ -291,7 +417,13 @@ class YouTubeClient:
                 # Press Escape to dismiss if Done button not found
                 self._dismiss_overlays()
 
-            page.wait_for_timeout(500)
+            # Wait for the dialog to actually close before moving on
+            try:
+                page.wait_for_selector(
+                    "ytcp-playlist-dialog", state="hidden", timeout=2000
+                )
+            except Exception:
+                pass
         except Exception as e:
             console.print(f"[yellow]Could not set playlist — skipping.[/yellow]")
             self._dismiss_overlays()
@@ -342,30 +474,35 @@ class YouTubeClient:
 
     def _extract_video_id(self) -> str:
         """Extract video ID from success dialog or page URL."""
-        page = self._page
-
-        try:
-            link = page.locator(
-                'a[href*="youtu.be"], a[href*="youtube.com/video"]'
-            ).first
-            href = link.get_attribute("href", timeout=5_000)
-            if href and "youtu.be/" in href:
-                return href.split("youtu.be/")[-1].split("?")[0]
-            if href and "youtube.com/video/" in href:
-                return href.split("youtube.com/video/")[-1].split("/")[0]
-        except Exception:
-            pass
-
+        # One evaluate scans the share link and the URL in a single
+        # round-trip, with no locator timeout when the link is absent
         try:
-            url = page.url
-            if "/video/" in url:
-                return url.split("/video/")[-1].split("/")[0]
+            return self._page.evaluate(r"""() => {
+                const a = document.querySelector(
+                    'a[href*="youtu.be/"], a[href*="youtube.com/video/"]'
+                );
+                if (a) {
+                    const m = a.href.match(
+                        /(?:youtu\.be\/|youtube\.com\/video\/)([^\/?#]+)/
+                    );
+                    if (m) return m[1];
+                }
+                const m2 = location.href.match(/\/video\/([^\/?#]+)/);
+                return m2 ? m2[1] : 'unknown';
+            }""")
         except Exception:
-            pass
-
-        return "unknown"
+            # Evaluate failed (e.g. navigation race) — fall back to the URL
+            # we have on the Python side
+            try:
+                m = _ID_RE.search(self._page.url)
+                if m:
+                    return m.group(1)
+            except Exception:
+                pass
+            return "unknown"
 
     def close_page(self) -> None:
         if self._page:
             self._page.close()
             self._page = None
+            self._locators.clear()
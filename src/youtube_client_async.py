@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import BrowserContext, Page
+from rich.console import Console
+
+from .models import UploadResult
+from .youtube_client import _DEBUG, _FILL_TEXTBOX_JS, _UPLOAD_SETTLED_JS
+
+console = Console()
+
+
+class YouTubeClientAsync:
+    """Async mirror of YouTubeClient for batch callers.
+
+    Takes a playwright.async_api BrowserContext (the CLI's single-upload
+    flow keeps the sync client, whose context cannot be driven from an
+    event loop). The win over the sync flow is that the description,
+    thumbnail, and playlist steps — which touch disjoint DOM subtrees —
+    run concurrently via asyncio.gather while the video bytes upload in
+    the background.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+        self._page: Optional[Page] = None
+
+    async def _get_page(self) -> Page:
+        if self._page is None:
+            self._page = await self._context.new_page()
+        return self._page
+
+    async def ensure_logged_in(self) -> None:
+        """Navigate to YouTube Studio; if not logged in, wait for user."""
+        page = await self._get_page()
+        await page.goto("https://studio.youtube.com")
+        await page.wait_for_load_state("domcontentloaded")
+
+        if "accounts.google.com" in page.url:
+            console.print(
+                "[yellow]Please log in to your Google account "
+                "in the browser window.[/yellow]"
+            )
+            await page.wait_for_url("**/studio.youtube.com/**", timeout=300_000)
+            await page.wait_for_load_state("domcontentloaded")
+
+    async def upload_video(
+        self,
+        file_path: Path,
+        title: str,
+        description: str,
+        privacy_status: str = "public",
+        made_for_kids: bool = False,
+        thumbnail_file: Optional[str] = None,
+        playlist_name: Optional[str] = None,
+    ) -> UploadResult:
+        """Upload a video through YouTube Studio UI."""
+        page = await self._get_page()
+        file_str = str(Path(file_path).resolve())
+
+        kids_name = "NOT_MADE_FOR_KIDS" if not made_for_kids else "MADE_FOR_KIDS"
+        privacy_name = privacy_status.upper()
+
+        await page.goto("https://studio.youtube.com")
+        try:
+            # Studio's background beacons can keep the network busy forever
+            await page.wait_for_load_state("networkidle", timeout=15_000)
+        except Exception:
+            pass
+
+        create_btn = page.locator(
+            "#create-icon, "
+            '[aria-label="Create"], '
+            'button:has-text("Create"), '
+            "#upload-icon"
+        ).first
+        try:
+            await create_btn.wait_for(state="visible", timeout=5000)
+            await create_btn.click()
+            await page.get_by_text("Upload videos").click()
+        except Exception:
+            await page.goto("https://studio.youtube.com/channel/UC/videos/upload?d=ud")
+            await page.wait_for_selector(
+                'input[type="file"]', state="attached", timeout=10_000
+            )
+
+        await page.locator('input[type="file"]').set_input_files(file_str)
+        await page.wait_for_selector("#title-textarea", state="visible", timeout=60_000)
+
+        # --- Details step: fill the independent sections concurrently ---
+        await page.locator("#title-textarea #textbox").evaluate(
+            _FILL_TEXTBOX_JS, title
+        )
+
+        tasks = [self._set_description(description)]
+        if thumbnail_file:
+            tasks.append(self._set_thumbnail(thumbnail_file))
+        if playlist_name:
+            tasks.append(self._set_playlist(playlist_name))
+        await asyncio.gather(*tasks)
+
+        await page.mouse.wheel(0, 300)
+        try:
+            await page.locator(f'[name="{kids_name}"]').click(timeout=5000)
+        except Exception:
+            console.print("[yellow]Could not set 'made for kids' — skipping.[/yellow]")
+
+        # --- Click NEXT through: Video elements → Checks → Visibility ---
+        for step in range(3):
+            try:
+                await page.locator("#next-button").click(timeout=10_000)
+                await page.wait_for_selector(
+                    "#next-button:not([aria-disabled='true']), #done-button",
+                    state="attached",
+                    timeout=10_000,
+                )
+            except Exception:
+                console.print(f"[yellow]Could not click Next at step {step + 1}.[/yellow]")
+
+        # --- Visibility step ---
+        try:
+            await page.locator(f'[name="{privacy_name}"]').click(timeout=5000)
+        except Exception:
+            console.print(f"[yellow]Could not set visibility to '{privacy_status}'.[/yellow]")
+
+        # Wait for the done button to enable or a visible error banner
+        try:
+            await page.wait_for_function(_UPLOAD_SETTLED_JS, timeout=600_000)
+        except Exception as e:
+            if _DEBUG:
+                await page.screenshot(path="yt_debug_upload_timeout.png")
+            raise RuntimeError("Upload timed out.") from e
+
+        publish_btn = (
+            page.locator("#done-button")
+            .or_(page.get_by_role("button", name="Publish"))
+            .or_(page.get_by_role("button", name="Save"))
+        )
+        await publish_btn.first.click(timeout=10_000)
+
+        try:
+            await page.wait_for_selector(
+                'a[href*="youtu.be"], a[href*="youtube.com/video"]',
+                state="attached",
+                timeout=10_000,
+            )
+        except Exception:
+            pass
+        video_id = await self._extract_video_id()
+
+        return UploadResult(video_id=video_id, title=title)
+
+    async def _set_description(self, description: str) -> None:
+        await self._page.locator("#description-textarea #textbox").evaluate(
+            _FILL_TEXTBOX_JS, description
+        )
+
+    async def _set_thumbnail(self, thumbnail_path: str) -> None:
+        """Upload a thumbnail from a local file."""
+        page = self._page
+        resolved = str(Path(thumbnail_path).resolve())
+        try:
+            await page.locator(
+                'input[type="file"][accept*="image"], '
+                '#still-picker input[type="file"]'
+            ).first.set_input_files(resolved, timeout=5000)
+        except Exception:
+            console.print("[yellow]Could not set thumbnail — skipping.[/yellow]")
+
+    async def _set_playlist(self, playlist_name: str) -> None:
+        """Select a playlist by name in the details step."""
+        page = self._page
+        try:
+            await page.locator("ytcp-video-metadata-playlists").click(timeout=5000)
+            await page.wait_for_selector(
+                "ytcp-playlist-dialog, tp-yt-paper-dialog",
+                state="visible",
+                timeout=5000,
+            )
+            checkbox = page.locator(f'label:has-text("{playlist_name}")')
+            if await checkbox.count() > 0:
+                await checkbox.first.click()
+            else:
+                console.print(
+                    f"[yellow]Playlist '{playlist_name}' not found — skipping.[/yellow]"
+                )
+            try:
+                await page.locator("ytcp-playlist-dialog").get_by_text(
+                    "Done", exact=True
+                ).click(timeout=3000)
+            except Exception:
+                await page.keyboard.press("Escape")
+        except Exception:
+            console.print("[yellow]Could not set playlist — skipping.[/yellow]")
+            await page.keyboard.press("Escape")
+
+    async def _extract_video_id(self) -> str:
+        """Extract video ID from success dialog or page URL."""
+        try:
+            return await self._page.evaluate(r"""() => {
+                const a = document.querySelector(
+                    'a[href*="youtu.be/"], a[href*="youtube.com/video/"]'
+                );
+                if (a) {
+                    const m = a.href.match(
+                        /(?:youtu\.be\/|youtube\.com\/video\/)([^\/?#]+)/
+                    );
+                    if (m) return m[1];
+                }
+                const m2 = location.href.match(/\/video\/([^\/?#]+)/);
+                return m2 ? m2[1] : 'unknown';
+            }""")
+        except Exception:
+            return "unknown"
+
+    async def close_page(self) -> None:
+        if self._page:
+            await self._page.close()
+            self._page = None
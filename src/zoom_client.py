@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+import shutil
 from datetime import date
 from getpass import getpass
 from pathlib import Path
@@ -11,17 +13,87 @@ from playwright.sync_api import BrowserContext, Page
 from rich.console import Console
 
 from .models import ZoomRecording
+from .retry import retry
 
 console = Console()
 
 SERVICE_NAME = "zoom-youtube-uploader"
 RECORDINGS_URL = "https://zoom.us/recording"
 
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# Matches Zoom's date displays: "Feb 3, 2026", "2/3/2026", or "2026-02-03"
+_DATE_RE = re.compile(
+    r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})"
+    r"|(\d{1,2})/(\d{1,2})/(\d{4})"
+    r"|(\d{4})-(\d{2})-(\d{2})"
+)
+
+
+# Matches a duration line: "HH:MM:SS"
+_DURATION_RE = re.compile(r"^\d{2}:\d{2}:\d{2}$")
+
+# Labels Zoom uses for the video file row on the recording detail page
+_VIDEO_LABELS = [
+    "Shared screen with speaker view",
+    "Shared screen with gallery view",
+    "Speaker view",
+    "Gallery view",
+    "Shared screen",
+    "Active speaker",
+]
+
+
+def _validate_mp4(dest_path: Path) -> int:
+    """Check the downloaded file looks like a video MP4; return its size.
+
+    Removes the file and raises RuntimeError when it is empty, not an MP4
+    (Zoom error page), or an audio-only M4A.
+    """
+    size = dest_path.stat().st_size
+    if size == 0:
+        dest_path.unlink(missing_ok=True)
+        raise RuntimeError("Downloaded file is empty (0 bytes).")
+
+    # Check MP4 magic bytes — valid MP4s have "ftyp" at offset 4
+    with open(dest_path, "rb") as f:
+        header = f.read(12)
+    if len(header) < 8 or header[4:8] != b"ftyp":
+        snippet = header[:64]
+        dest_path.unlink(missing_ok=True)
+        raise RuntimeError(
+            f"Downloaded file is not a valid MP4 (header: {snippet!r}). "
+            "Zoom may have returned an error page instead of the video."
+        )
+    # Detect audio-only M4A files (ftypM4A) — we need video (ftypmp42, ftypisom, etc.)
+    ftyp_brand = header[8:12]
+    if ftyp_brand == b"M4A ":
+        dest_path.unlink(missing_ok=True)
+        raise RuntimeError(
+            "Downloaded file is audio-only (M4A), not a video MP4. "
+            "The script may have downloaded 'Audio only' instead of "
+            "'Shared screen with speaker view'."
+        )
+    return size
+
+
+def _date_match_ymd(m: re.Match) -> tuple[int, int, int]:
+    """Normalize a _DATE_RE match to a (year, month, day) tuple."""
+    if m.group(1):
+        return int(m.group(3)), _MONTHS[m.group(1)], int(m.group(2))
+    if m.group(4):
+        return int(m.group(6)), int(m.group(4)), int(m.group(5))
+    return int(m.group(7)), int(m.group(8)), int(m.group(9))
+
 
 class ZoomClient:
     def __init__(self, context: BrowserContext):
         self._context = context
         self._page: Optional[Page] = None
+        self._creds: Optional[tuple[str, str]] = None
 
     def _get_page(self) -> Page:
         if self._page is None:
@@ -29,7 +101,14 @@ class ZoomClient:
         return self._page
 
     def _get_credentials(self) -> tuple[str, str]:
-        """Read Zoom email/password from credential manager, prompt if missing."""
+        """Read Zoom email/password from credential manager, prompt if missing.
+
+        Cached after the first lookup — each keyring call is an RPC to the
+        OS credential store.
+        """
+        if self._creds is not None:
+            return self._creds
+
         email = keyring.get_password(SERVICE_NAME, "zoom_email")
         password = keyring.get_password(SERVICE_NAME, "zoom_password")
 
@@ -44,8 +123,10 @@ class ZoomClient:
                 keyring.set_password(SERVICE_NAME, "zoom_password", password)
             print()
 
-        return email, password
+        self._creds = (email, password)
+        return self._creds
 
+    @retry(max_retries=2)
     def ensure_logged_in(self) -> None:
         """Navigate to Zoom recordings; auto-fill login if needed."""
         page = self._get_page()
@@ -80,71 +161,54 @@ class ZoomClient:
         page.goto(RECORDINGS_URL, wait_until="domcontentloaded")
         page.wait_for_timeout(3000)
 
-        # Build multiple date patterns to match against Zoom's display format
-        # e.g. for Feb 3, 2026: match "Feb 3, 2026", "Feb 03, 2026", "2/3/2026", etc.
-        target_month = recording_date.month
-        target_day = recording_date.day
-        target_year = recording_date.year
-        date_patterns = [
-            f"{recording_date.strftime('%b')} {target_day}, {target_year}",   # Feb 3, 2026
-            f"{recording_date.strftime('%b')} {target_day:02d}, {target_year}", # Feb 03, 2026
-            f"{target_month}/{target_day}/{target_year}",                      # 2/3/2026
-            f"{target_month:02d}/{target_day:02d}/{target_year}",              # 02/03/2026
-            recording_date.isoformat(),                                        # 2026-02-03
-        ]
-
-        # Regex to detect any date-like line: "Mon DD, YYYY" or "MM/DD/YYYY"
-        date_line_re = re.compile(
-            r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}"
-            r"|\d{1,2}/\d{1,2}/\d{4}"
-        )
+        # Compare parsed (year, month, day) tuples rather than substring-
+        # matching a list of display-format variants — one regex extraction
+        # per row, and "Feb 3" can no longer match inside "Feb 30"
+        target_ymd = (recording_date.year, recording_date.month, recording_date.day)
 
-        # Regex to detect duration: "HH:MM:SS"
-        duration_re = re.compile(r"^\d{2}:\d{2}:\d{2}$")
+        # Fetch every recording entry's text and href across all result
+        # pages in one round-trip — per-link inner_text()/get_attribute()
+        # calls cost ~2 IPC trips each, and page 2+ was never read at all
+        rows = self._scrape_all_rows()
 
-        # Find all recording entry links
-        links = page.locator(
-            'a[href*="/recording/detail"], '
-            'a[href*="/rec/share"]'
-        )
-        count = links.count()
-
-        if count == 0:
+        if not rows:
             return []
 
         recordings = []
         seen = set()
 
-        for i in range(count):
-            link = links.nth(i)
-            text = link.inner_text().strip()
-            lines = [l.strip() for l in text.split("\n") if l.strip()]
-
-            # Skip short entries (duplicates with just file count + duration)
-            if len(lines) <= 2:
-                continue
-
-            # Clean lines
-            lines = [l for l in lines if not l.startswith("Press Shift")]
-
-            # Find date, duration, and topic by content, not position
+        for row in rows:
+            # One pass over the lines: strip, drop noise, and pick out the
+            # date, duration, and topic by content, not position
             date_text = ""
             duration = ""
             topic = ""
+            n_lines = 0
 
-            for line in lines:
-                if not date_text and date_line_re.search(line):
+            for raw in row["text"].split("\n"):
+                line = raw.strip()
+                if not line:
+                    continue
+                n_lines += 1
+                if line.startswith("Press Shift"):
+                    continue
+                if not date_text and _DATE_RE.search(line):
                     date_text = line
-                elif not duration and duration_re.match(line):
+                elif not duration and _DURATION_RE.match(line):
                     duration = line
                 elif not topic and not line.isdigit() and len(line) > 3:
                     topic = line
 
+            # Skip short entries (duplicates with just file count + duration)
+            if n_lines <= 2:
+                continue
+
             if not topic:
                 topic = "Unknown"
 
             # Filter by requested date
-            if not any(pat in date_text for pat in date_patterns):
+            m = _DATE_RE.search(date_text)
+            if not m or _date_match_ymd(m) != target_ymd:
                 continue
 
             # Deduplicate
@@ -153,18 +217,52 @@ class ZoomClient:
                 continue
             seen.add(key)
 
-            href = link.get_attribute("href") or ""
-
             recordings.append(ZoomRecording(
                 topic=topic,
                 date=date_text,
                 duration=duration,
                 file_size="",
-                download_url=href,
+                download_url=row["href"],
             ))
 
         return recordings
 
+    def _scrape_all_rows(self) -> list[dict]:
+        """Collect {text, href} for recording links, following pagination.
+
+        Runs entirely inside one evaluate: each iteration harvests the
+        visible links, then clicks Next Page (if enabled) and lets the list
+        re-render. Capped at 25 pages as a runaway guard.
+        """
+        return self._page.evaluate(
+            """async () => {
+                const out = [];
+                const seen = new Set();
+                for (let i = 0; i < 25; i++) {
+                    document.querySelectorAll(
+                        'a[href*="/recording/detail"], a[href*="/rec/share"]'
+                    ).forEach(a => {
+                        const href = a.getAttribute('href') || '';
+                        const key = href + '|' + a.innerText;
+                        if (!seen.has(key)) {
+                            seen.add(key);
+                            out.push({text: a.innerText, href: href});
+                        }
+                    });
+                    const next = document.querySelector(
+                        '[aria-label="Next Page"], [aria-label="Next page"]'
+                    );
+                    if (!next || next.disabled
+                        || next.getAttribute('aria-disabled') === 'true') {
+                        break;
+                    }
+                    next.click();
+                    await new Promise(r => setTimeout(r, 1500));
+                }
+                return out;
+            }"""
+        )
+
     def download_recording(
         self,
         recording: ZoomRecording,
@@ -177,7 +275,10 @@ class ZoomClient:
         url = recording.download_url
         if not url.startswith("http"):
             url = f"https://zoom.us{url}"
-        page.goto(url, wait_until="domcontentloaded")
+
+        # A transient nav failure here is much cheaper to retry than to
+        # fail the whole download
+        retry(max_retries=2)(page.goto)(url, wait_until="domcontentloaded")
         page.wait_for_timeout(3000)
 
         # Take a screenshot for debugging if needed
@@ -197,70 +298,53 @@ class ZoomClient:
 
         # Strategy 1: Find the video row's per-file download icon
         # The row has: [icon] "Shared screen with speaker view" [download-icon] [link-icon] [delete-icon]
-        video_labels = [
-            "Shared screen with speaker view",
-            "Shared screen with gallery view",
-            "Speaker view",
-            "Gallery view",
-            "Shared screen",
-            "Active speaker",
-        ]
-
         download_triggered = False
 
+        # One :visible union across every label — a single protocol query
+        # instead of count() + nth(j).is_visible() per label
+        video_link_sel = ", ".join(
+            f'a:visible:has-text("{label}")' for label in _VIDEO_LABELS
+        )
+
         # Strategy 1: Find the video file's play URL (<a> with /rec/play/) and
         # convert it to a download URL (/rec/download/).
         # The page has links like: <a href="/rec/play/ABC...">Shared screen with speaker view</a>
-        for label in video_labels:
-            try:
-                # Find <a> elements whose text matches the video label
-                loc = page.locator(f'a:has-text("{label}")')
-                for j in range(loc.count()):
-                    el = loc.nth(j)
-                    if not el.is_visible():
-                        continue
-                    href = el.get_attribute("href") or ""
-                    if "/rec/play/" in href:
-                        # Convert play URL to download URL
-                        download_url = href.replace("/rec/play/", "/rec/download/")
-                        console.print(f"[dim]Video download URL: {download_url}[/dim]")
-                        with page.expect_download(timeout=600_000) as download_info:
-                            page.evaluate(f"window.location.href = '{download_url}'")
-                        download_triggered = True
-                        break
-                if download_triggered:
+        try:
+            for el in page.locator(video_link_sel).all():
+                href = el.get_attribute("href") or ""
+                if "/rec/play/" in href:
+                    # Convert play URL to download URL
+                    download_url = href.replace("/rec/play/", "/rec/download/")
+                    console.print(f"[dim]Video download URL: {download_url}[/dim]")
+                    with page.expect_download(timeout=600_000) as download_info:
+                        page.evaluate(f"window.location.href = '{download_url}'")
+                    download_triggered = True
                     break
-            except Exception:
-                continue
+        except Exception:
+            pass
 
         # Strategy 2: Navigate to the video play page and find a download button there
         if not download_triggered:
-            for label in video_labels:
-                try:
-                    loc = page.locator(f'a:has-text("{label}")')
-                    for j in range(loc.count()):
-                        el = loc.nth(j)
-                        if not el.is_visible():
-                            continue
-                        href = el.get_attribute("href") or ""
-                        if "/rec/play/" in href or "/rec/" in href:
-                            # Navigate to the individual file play page
-                            play_url = href if href.startswith("http") else f"https://zoom.us{href}"
-                            page.goto(play_url, wait_until="domcontentloaded")
-                            page.wait_for_timeout(3000)
-                            # Look for a download button on the play page
-                            dl_btn = page.locator('button:has-text("Download"), a:has-text("Download")')
-                            for k in range(dl_btn.count()):
-                                if dl_btn.nth(k).is_visible():
-                                    with page.expect_download(timeout=600_000) as download_info:
-                                        dl_btn.nth(k).click()
-                                    download_triggered = True
-                                    break
-                            break
-                    if download_triggered:
+            try:
+                for el in page.locator(video_link_sel).all():
+                    href = el.get_attribute("href") or ""
+                    if "/rec/play/" in href or "/rec/" in href:
+                        # Navigate to the individual file play page
+                        play_url = href if href.startswith("http") else f"https://zoom.us{href}"
+                        page.goto(play_url, wait_until="domcontentloaded")
+                        page.wait_for_timeout(3000)
+                        # Look for a visible download button on the play page
+                        dl_btn = page.locator(
+                            'button:visible:has-text("Download"), '
+                            'a:visible:has-text("Download")'
+                        ).first
+                        if dl_btn.count() > 0:
+                            with page.expect_download(timeout=600_000) as download_info:
+                                dl_btn.click()
+                            download_triggered = True
                         break
-                except Exception:
-                    continue
+            except Exception:
+                pass
 
         # Strategy 3: Fallback — click the top-level Download button (not Download All)
         if not download_triggered:
@@ -270,21 +354,15 @@ class ZoomClient:
                 dl_btn = page.locator('button:has-text("Download")').first
                 if dl_btn.is_visible():
                     dl_btn.click()
-                    page.wait_for_timeout(2000)
-                    # Check for confirmation dialog
-                    for sel in [
-                        '[role="dialog"] button:has-text("Download")',
-                        '.zm-modal-footer button:has-text("Download")',
-                    ]:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0 and loc.first.is_visible():
-                                with page.expect_download(timeout=600_000) as download_info:
-                                    loc.first.click()
-                                download_triggered = True
-                                break
-                        except Exception:
-                            continue
+                    # One :visible union covers both confirmation dialogs
+                    confirm = page.locator(
+                        '[role="dialog"] button:visible:has-text("Download"), '
+                        '.zm-modal-footer button:visible:has-text("Download")'
+                    ).first
+                    confirm.wait_for(state="visible", timeout=5000)
+                    with page.expect_download(timeout=600_000) as download_info:
+                        confirm.click()
+                    download_triggered = True
             except Exception:
                 pass
 
@@ -300,33 +378,17 @@ class ZoomClient:
         if failure:
             raise RuntimeError(f"Download failed: {failure}")
 
-        download.save_as(str(dest_path))
+        # Move the browser's temp file into place instead of save_as, which
+        # copies the full file — an atomic rename when on the same
+        # filesystem (the context's downloads_path targets the temp dir)
+        src_file = download.path()
+        try:
+            os.replace(src_file, dest_path)
+        except OSError:
+            shutil.move(str(src_file), str(dest_path))
 
         # Validate the downloaded file
-        size = dest_path.stat().st_size
-        if size == 0:
-            dest_path.unlink(missing_ok=True)
-            raise RuntimeError("Downloaded file is empty (0 bytes).")
-
-        # Check MP4 magic bytes — valid MP4s have "ftyp" at offset 4
-        with open(dest_path, "rb") as f:
-            header = f.read(12)
-        if len(header) < 8 or header[4:8] != b"ftyp":
-            snippet = header[:64]
-            dest_path.unlink(missing_ok=True)
-            raise RuntimeError(
-                f"Downloaded file is not a valid MP4 (header: {snippet!r}). "
-                "Zoom may have returned an error page instead of the video."
-            )
-        # Detect audio-only M4A files (ftypM4A) — we need video (ftypmp42, ftypisom, etc.)
-        ftyp_brand = header[8:12]
-        if ftyp_brand == b"M4A ":
-            dest_path.unlink(missing_ok=True)
-            raise RuntimeError(
-                "Downloaded file is audio-only (M4A), not a video MP4. "
-                "The script may have downloaded 'Audio only' instead of "
-                "'Shared screen with speaker view'."
-            )
+        size = _validate_mp4(dest_path)
 
         console.print(f"[dim]File size: {size / (1024 * 1024):.1f} MB[/dim]")
         return dest_path
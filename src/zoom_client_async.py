@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from playwright.async_api import BrowserContext
+from rich.console import Console
+
+from .models import ZoomRecording
+from .zoom_client import _VIDEO_LABELS, _validate_mp4
+
+console = Console()
+
+
+class ZoomClientAsync:
+    """Async Zoom downloader for batch callers.
+
+    Takes a playwright.async_api BrowserContext and opens one page per
+    download, so several network-bound MP4 streams overlap instead of
+    running back to back (the CLI's single-recording flow keeps the sync
+    client). Login is assumed to be established — reuse the session the
+    sync client persisted.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+
+    async def download_recording(
+        self,
+        recording: ZoomRecording,
+        dest_path: Path,
+    ) -> Path:
+        """Download one recording's MP4 on its own page."""
+        page = await self._context.new_page()
+        try:
+            url = recording.download_url
+            if not url.startswith("http"):
+                url = f"https://zoom.us{url}"
+            await page.goto(url, wait_until="domcontentloaded")
+            await page.wait_for_timeout(3000)
+
+            video_link_sel = ", ".join(
+                f'a:visible:has-text("{label}")' for label in _VIDEO_LABELS
+            )
+
+            # Same play-URL-to-download-URL conversion as the sync client
+            download = None
+            for el in await page.locator(video_link_sel).all():
+                href = await el.get_attribute("href") or ""
+                if "/rec/play/" in href:
+                    download_url = href.replace("/rec/play/", "/rec/download/")
+                    async with page.expect_download(timeout=600_000) as dl_info:
+                        await page.evaluate(
+                            f"window.location.href = '{download_url}'"
+                        )
+                    download = await dl_info.value
+                    break
+
+            if download is None:
+                raise RuntimeError(
+                    f"Could not trigger download for '{recording.topic}'. "
+                    "Try downloading manually."
+                )
+
+            failure = await download.failure()
+            if failure:
+                raise RuntimeError(f"Download failed: {failure}")
+
+            src_file = await download.path()
+            try:
+                os.replace(src_file, dest_path)
+            except OSError:
+                shutil.move(str(src_file), str(dest_path))
+
+            _validate_mp4(dest_path)
+            return dest_path
+        finally:
+            await page.close()
+
+    async def download_many(
+        self,
+        tasks: Iterable[Tuple[ZoomRecording, Path]],
+        max_concurrency: int = 3,
+    ) -> list:
+        """Download several recordings concurrently.
+
+        Bounded by a semaphore so we don't saturate bandwidth or open an
+        unreasonable number of pages. Returns results in task order, with
+        exceptions in place of paths for failed downloads.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(recording: ZoomRecording, dest_path: Path) -> Path:
+            async with sem:
+                return await self.download_recording(recording, dest_path)
+
+        return await asyncio.gather(
+            *(bounded(r, p) for r, p in tasks),
+            return_exceptions=True,
+        )